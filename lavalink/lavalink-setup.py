@@ -1,47 +1,162 @@
+import atexit
+import hashlib
+import json
+import os
 import re
+import shutil
 import signal
 import subprocess
 import sys
+import zipfile
 from pathlib import Path
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 # This script is mainly used for development purposes to easily setup and run Lavalink.
+# An existing Lavalink.jar is used as-is; set LAVALINK_AUTO_UPDATE=1 to check
+# GitHub for a newer release on startup.
 
 SCRIPT_DIR = Path(__file__).parent.resolve()
 LAVALINK_DIR = SCRIPT_DIR
 JAR_NAME = "Lavalink.jar"
 LAVALINK_JAR = LAVALINK_DIR / JAR_NAME
+ETAG_FILE = LAVALINK_DIR / f"{JAR_NAME}.etag"
+PART_FILE = LAVALINK_DIR / f"{JAR_NAME}.part"
+CHUNK_SIZE = 1 << 20
+AUTO_UPDATE = os.environ.get("LAVALINK_AUTO_UPDATE", "").lower() in {"1", "true", "yes"}
 GITHUB_API_RELEASES = (
     "https://api.github.com/repos/lavalink-devs/Lavalink/releases/latest"
 )
+HTTP_TIMEOUT = (5, 30)
+# Extract version number (works for OpenJDK 17+, 18+, etc.)
+JAVA_VERSION_RE = re.compile(r'version "(?P<ver>\d+)(\.(\d+))?')
+JAVA_RELEASE_RE = re.compile(r'^JAVA_VERSION="(?P<ver>\d+)(\.(\d+))?', re.MULTILINE)
+JAVA_VERSION_CACHE = Path.home() / ".cache" / "molten-musicbot" / "java_version.json"
+
+# Shared session so the metadata and download requests reuse connections.
+session = requests.Session()
+session.headers["User-Agent"] = "molten-musicbot-setup"
+session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
 
 
 def get_latest_lavalink_url():
-    resp = requests.get(GITHUB_API_RELEASES, timeout=10)
+    """Return the download URL, name and published SHA-256 (or None) of the latest jar."""
+    resp = session.get(
+        GITHUB_API_RELEASES,
+        headers={"Accept": "application/vnd.github+json"},
+        timeout=HTTP_TIMEOUT,
+    )
     resp.raise_for_status()
-    data = resp.json()
-    for asset in data.get("assets", []):
-        if asset.get("name", "").endswith(".jar"):
-            return asset["browser_download_url"], asset["name"]
-    raise RuntimeError("Could not find Lavalink .jar in latest release assets.")
+    data = orjson.loads(resp.content)
+    asset = next(
+        (a for a in data.get("assets", []) if a.get("name", "").endswith(".jar")),
+        None,
+    )
+    if asset is None:
+        raise RuntimeError("Could not find Lavalink .jar in latest release assets.")
+    digest = asset.get("digest") or ""
+    sha256 = digest.split(":", 1)[1] if digest.startswith("sha256:") else None
+    return asset["browser_download_url"], asset["name"], sha256
+
+
+def sha256_of(path):
+    """Hash a file in 1MB chunks so the whole jar never sits in memory."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_etag(jar):
+    """Return the stored ETag, but only if it was recorded for `jar` as it is now."""
+    try:
+        stored = json.loads(ETAG_FILE.read_text())
+        st = jar.stat()
+    except (OSError, ValueError):
+        return None
+    if not isinstance(stored, dict):
+        return None
+    if stored.get("size") != st.st_size or stored.get("mtime_ns") != st.st_mtime_ns:
+        return None
+    return stored.get("etag")
+
+
+def _write_etag(jar, etag):
+    st = jar.stat()
+    ETAG_FILE.write_text(
+        json.dumps({"etag": etag, "size": st.st_size, "mtime_ns": st.st_mtime_ns})
+    )
+
+
+def _download(resp, name, expected_sha256):
+    """Stream the jar into PART_FILE and check it is complete and intact."""
+    # The jar is served as-is, so skip content decoding and copy in 1MB blocks.
+    resp.raw.decode_content = False
+    with open(PART_FILE, "wb") as f:
+        shutil.copyfileobj(resp.raw, f, length=CHUNK_SIZE)
+
+    expected_size = resp.headers.get("Content-Length")
+    if expected_size and PART_FILE.stat().st_size != int(expected_size):
+        raise RuntimeError(f"Incomplete download of {name}.")
+    if expected_sha256 and sha256_of(PART_FILE) != expected_sha256:
+        raise RuntimeError(f"Checksum mismatch for downloaded {name}.")
+    if not zipfile.is_zipfile(PART_FILE):
+        raise RuntimeError(f"Downloaded {name} is not a valid jar.")
 
 
 def ensure_lavalink():
     LAVALINK_DIR.mkdir(exist_ok=True)
     target = LAVALINK_DIR / JAR_NAME
-    if target.exists():
-        print("✅ Lavalink.jar already present.")
+
+    # A jar is a zip archive, so a truncated one fails this cheap check.
+    have_jar = target.exists() and zipfile.is_zipfile(target)
+    if have_jar and not AUTO_UPDATE:
+        print("✅ Using existing Lavalink.jar.")
         return target
+    if target.exists() and not have_jar:
+        print("⚠️  Existing Lavalink.jar is not a valid jar, downloading it again.")
+
+    try:
+        url, name, expected_sha256 = get_latest_lavalink_url()
+    except requests.RequestException as e:
+        if have_jar:
+            print(f"⚠️  Could not check for Lavalink updates ({e}), using existing jar.")
+            return target
+        raise
+
+    headers = {}
+    if have_jar:
+        if expected_sha256 and sha256_of(target) == expected_sha256:
+            print("✅ Lavalink.jar already present and up to date.")
+            return target
+        etag = None if expected_sha256 else _read_etag(target)
+        if etag:
+            headers["If-None-Match"] = etag
 
     print("⬇️  Downloading latest Lavalink release...")
-    url, name = get_latest_lavalink_url()
-    resp = requests.get(url, stream=True, timeout=30)
+    resp = session.get(url, headers=headers, stream=True, timeout=HTTP_TIMEOUT)
+    if resp.status_code == 304:
+        print("✅ Lavalink.jar already present and up to date.")
+        return target
     resp.raise_for_status()
 
-    with open(target, "wb") as f:
-        for chunk in resp.iter_content(chunk_size=8192):
-            f.write(chunk)
+    # Download next to the jar and swap it in only once it checks out, so an
+    # interrupted or corrupt download never replaces a working jar. The old
+    # ETag goes first: it must never end up describing a partial jar.
+    ETAG_FILE.unlink(missing_ok=True)
+    try:
+        _download(resp, name, expected_sha256)
+    except BaseException:
+        PART_FILE.unlink(missing_ok=True)
+        raise
+    os.replace(PART_FILE, target)
+
+    etag = resp.headers.get("ETag")
+    if etag:
+        _write_etag(target, etag)
 
     print("✅ Download complete:", target)
     return target
@@ -53,44 +168,97 @@ def run_lavalink(jar_path):
         raise FileNotFoundError(f"{jar_path} not found")
     print("🚀 Starting Lavalink...")
 
+    resolved = jar_path.resolve()
+    # Inherit our stdout/stderr so the JVM writes straight to the terminal.
+    # Run it in its own session so terminal signals only reach our handlers,
+    # which then stop the JVM in an orderly way.
     process = subprocess.Popen(
-        ["java", "-jar", str(jar_path.resolve())],
-        cwd=jar_path.parent,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
+        ["java", "-jar", str(resolved)],
+        cwd=resolved.parent,
+        close_fds=True,
+        start_new_session=True,
     )
 
-    def shutdown_handler(signum, frame):
+    def stop_lavalink():
+        if process.poll() is not None:
+            return
         print("\n🛑 Stopping Lavalink...")
         process.terminate()
         try:
             process.wait(timeout=5)
         except subprocess.TimeoutExpired:
             process.kill()
+
+    def shutdown_handler(signum, frame):
+        stop_lavalink()
         sys.exit(0)
 
+    # The JVM is outside the terminal's process group, so anything that ends
+    # this script (including the terminal closing) has to stop it explicitly.
+    atexit.register(stop_lavalink)
     signal.signal(signal.SIGINT, shutdown_handler)
     signal.signal(signal.SIGTERM, shutdown_handler)
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, shutdown_handler)
 
     try:
-        for line in process.stdout:
-            print(line.decode(errors="ignore"), end="")
+        process.wait()
     except KeyboardInterrupt:
         shutdown_handler(None, None)
 
 
-def check_java(min_version=17):
-    """Check if Java is installed and is at least min_version."""
+def _major_from_match(match):
+    """Turn a parsed "1.8" / "17.0" style version into its major number."""
+    major = int(match.group("ver"))
+    if major == 1 and match.group(3):
+        return int(match.group(3))
+    return major
+
+
+def _java_version_from_release(java_path):
+    """Read the version from $JAVA_HOME/release without starting a JVM."""
+    java_home = os.environ.get("JAVA_HOME")
+    if not java_home:
+        return None
+    home = Path(java_home).resolve()
+    if home not in Path(java_path).resolve().parents:
+        return None
     try:
-        result = subprocess.run(
-            ["java", "-version"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-    except FileNotFoundError:
-        print("❌ Java not found! Please install Java 17+ and add it to PATH.")
-        sys.exit(1)
+        match = JAVA_RELEASE_RE.search((home / "release").read_text())
+    except OSError:
+        return None
+    return _major_from_match(match) if match else None
+
+
+def _java_cache_key(java_path):
+    st = os.stat(java_path)
+    return f"{Path(java_path).resolve()}:{st.st_ino}:{st.st_mtime_ns}"
+
+
+def _read_cached_java_version(key):
+    try:
+        cache = json.loads(JAVA_VERSION_CACHE.read_text())
+    except (OSError, ValueError):
+        return None
+    return cache.get("version") if cache.get("key") == key else None
+
+
+def _write_cached_java_version(key, version):
+    try:
+        JAVA_VERSION_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        JAVA_VERSION_CACHE.write_text(json.dumps({"key": key, "version": version}))
+    except OSError:
+        pass
+
+
+def _probe_java_version():
+    """Run 'java -version' and parse the major version from its output."""
+    result = subprocess.run(
+        ["java", "-version"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
 
     # Java prints version info to stderr
     if result.returncode != 0:
@@ -106,13 +274,30 @@ def check_java(min_version=17):
         sys.exit(1)
     version_line = stderr_lines[0]
 
-    # Extract version number (works for OpenJDK 17+, 18+, etc.)
-    match = re.search(r'version "(?P<ver>\d+)(\.(\d+))?', version_line)
+    match = JAVA_VERSION_RE.search(version_line)
     if not match:
         print("❌ Could not parse Java version.")
         sys.exit(1)
+    return _major_from_match(match)
+
+
+def check_java(min_version=17):
+    """Check if Java is installed and is at least min_version."""
+    java_path = shutil.which("java")
+    if java_path is None:
+        print("❌ Java not found! Please install Java 17+ and add it to PATH.")
+        sys.exit(1)
+
+    # Starting a JVM just to read its version is slow, so prefer the JDK's
+    # release file and a cache keyed on the java binary.
+    major_version = _java_version_from_release(java_path)
+    if major_version is None:
+        key = _java_cache_key(java_path)
+        major_version = _read_cached_java_version(key)
+        if major_version is None:
+            major_version = _probe_java_version()
+            _write_cached_java_version(key, major_version)
 
-    major_version = int(match.group("ver"))
     if major_version < min_version:
         print(
             f"❌ Java version {major_version} detected, but Lavalink requires {min_version}+."
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Optional, Sequence
 
 from discord import Interaction
 from discord.ui import Button, View, button
 
-import lavalink
 from utils import Error
 
 if TYPE_CHECKING:
+    import lavalink
+
     from music_bot import Bot
 
 
@@ -22,6 +23,14 @@ class ControlButton(Enum):
     SHUFFLE = "control_shuffle"
 
 
+# Disables every control, e.g. when nothing is playing.
+ALL_CONTROL_BUTTONS = tuple(ControlButton)
+
+# One bit per control button so the disabled set can be computed as a mask.
+_BUTTON_BITS = {btn.value: 1 << i for i, btn in enumerate(ControlButton)}
+_ALL_BUTTONS_MASK = (1 << len(ControlButton)) - 1
+
+
 class PlayerControlView(View):
     """
     A Discord UI view for player control buttons with enum-based button control.
@@ -31,34 +40,42 @@ class PlayerControlView(View):
         self,
         bot: Bot,
         player: Optional[lavalink.DefaultPlayer],
-        disabled_buttons: List[ControlButton] = None,
+        disabled_buttons: Sequence[ControlButton] = None,
         *,
         timeout: float = None,
     ):
         super().__init__(timeout=timeout)
         self.bot = bot
+        self.update_state(player, disabled_buttons)
+
+    def update_state(
+        self,
+        player: Optional[lavalink.DefaultPlayer],
+        disabled_buttons: Sequence[ControlButton] = None,
+    ) -> PlayerControlView:
+        """
+        Re-applies the button states for `player` in place so the same view
+        can be reused across setup message updates.
+        """
         self.player = player
-        disabled_ids = [btn.value for btn in (disabled_buttons or [])]
+        if player is None:
+            mask = _ALL_BUTTONS_MASK
+            paused = False
+        else:
+            mask = sum(_BUTTON_BITS[btn.value] for btn in set(disabled_buttons or ()))
+            if len(player.queue) <= 1:
+                mask |= _BUTTON_BITS[ControlButton.SHUFFLE.value]
+            paused = player.paused
 
-        # Set button states
+        # Set button states in a single pass
         for child in self.children:
             if not isinstance(child, Button):
                 continue
 
-            # Automatic state management
-            if self.player is None:
-                child.disabled = True
-            elif child.custom_id == ControlButton.PAUSE_RESUME.value:
-                child.emoji = "▶️" if self.player.paused else "⏸️"
-            elif (
-                len(self.player.queue) <= 1
-                and child.custom_id == ControlButton.SHUFFLE.value
-            ):
-                child.disabled = True
-
-            # Apply manual disables
-            if child.custom_id in disabled_ids:
-                child.disabled = True
+            child.disabled = bool(mask & _BUTTON_BITS[child.custom_id])
+            if child.custom_id == ControlButton.PAUSE_RESUME.value:
+                child.emoji = "▶️" if paused else "⏸️"
+        return self
 
     @button(emoji="⏹️", custom_id=ControlButton.STOP.value)
     async def stop_button(self, interaction: Interaction, button: Button):
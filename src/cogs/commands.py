@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
 
 import discord
 from discord import app_commands
@@ -12,6 +12,72 @@ from utils import Error
 if TYPE_CHECKING:
     from music_bot import Bot
 
+_DJ_ROLE = SetupChannelKeys.DJ_ROLE
+_DJ_ROLE_NAME = SetupChannelKeys.DJ_ROLE_NAME
+# Commands that are not gated behind the DJ role.
+_DJ_EXEMPT_COMMANDS = frozenset({"setup", "create_dj", "remove_dj", "help"})
+
+
+def _missing_permissions_message(missing) -> str:
+    return f"🚫 You need the `{', '.join(missing)}` permission(s) to use this command."
+
+
+# Prebuilt replies for the permissions this cog actually checks.
+_MISSING_MESSAGES = {
+    frozenset({perm}): _missing_permissions_message((perm,))
+    for perm in ("manage_guild", "manage_roles", _DJ_ROLE_NAME)
+}
+
+_HELP_TITLE = "Music Bot Setup Help"
+_HELP_MESSAGE = """
+To set up a music request channel in your server, use the `/setup` command. This will create a dedicated channel where users can send song requests.
+
+Once the channel is created, you can:
+- Use the `/play <song name>` command to play a song.
+- Use the `/skip [count]` command to skip the current song.
+- Use the `/toggle` command to pause or resume the song.
+- Use the `/stop` command to stop playback and clear the queue.
+- Use the `/shuffle` command to shuffle the current queue.
+- Use the `/247` command to enable or disable 24/7 mode for the music channel.
+- Use the `/nightcore` command to toggle the Nightcore effect on or off.
+- Use the `/create_dj` command to create a DJ role that can manage the music channel and commands.
+- Use the `/remove_dj` command to remove the DJ role and make the channel public.
+- Use the `/disconnect` command to disconnect the player and stop playback.
+- Use the `/forward <seconds>` command to skip forward by a given number of seconds.
+- Use the `/queue` command to display the current queue of songs.
+
+The bot will automatically manage the player and display the current song status in the setup channel.
+
+Happy listening! 🎶
+"""
+
+
+def dj_role_required(interaction: discord.Interaction) -> bool:
+    """
+    Checks if the user has the DJ role required for music commands.
+    Uses the DJ role stored in the setup_channels via its ID.
+    If no DJ role is stored for the guild, the command is allowed.
+    Membership is tested by ID against the member's sorted role IDs, without
+    materialising the member's Role objects.
+    """
+    guild = interaction.guild
+    if guild is None:
+        return True
+
+    bot: Bot = interaction.client
+    setup_data = bot.setup_channels.get(guild.id)
+    if not setup_data or _DJ_ROLE not in setup_data:
+        return True
+
+    dj_role_id = setup_data[_DJ_ROLE]
+    if (
+        interaction.user.get_role(dj_role_id) is not None
+        or guild.get_role(dj_role_id) is None
+    ):
+        return True
+
+    raise app_commands.MissingPermissions([_DJ_ROLE_NAME])
+
 
 class MusicCommands(commands.Cog):
     """
@@ -21,14 +87,25 @@ class MusicCommands(commands.Cog):
 
     def __init__(self, bot: Bot):
         self.bot: Bot = bot
+        self._help_embed = discord.Embed(
+            title=_HELP_TITLE, description=_HELP_MESSAGE.strip()
+        )
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Applies the DJ role check once for every music command in this cog."""
+        command = interaction.command
+        if command is not None and command.name in _DJ_EXEMPT_COMMANDS:
+            return True
+        return dj_role_required(interaction)
 
     async def cog_app_command_error(
         self, interaction: discord.Interaction, error: app_commands.AppCommandError
     ):
         if isinstance(error, app_commands.MissingPermissions):
-            missing = ", ".join(error.missing_permissions)
+            missing = error.missing_permissions
+            message = _MISSING_MESSAGES.get(frozenset(missing))
             await interaction.response.send_message(
-                f"🚫 You need the `{missing}` permission(s) to use this command.",
+                message or _missing_permissions_message(missing),
                 ephemeral=True,
                 delete_after=5,
             )
@@ -38,26 +115,21 @@ class MusicCommands(commands.Cog):
             )
             raise error
 
-    def dj_role_required(interaction: discord.Interaction) -> bool:
-        """
-        Checks if the user has the DJ role required for music commands.
-        Uses the DJ role stored in the setup_channels via its ID.
-        If no DJ role is stored for the guild, the command is allowed.
-        """
-        guild = interaction.guild
-        if guild is None:
-            return True
-
-        bot: Bot = interaction.client
-        setup_data = bot.setup_channels.get(guild.id)
-        dj_role = None
-        if setup_data and SetupChannelKeys.DJ_ROLE in setup_data:
-            dj_role = guild.get_role(setup_data[SetupChannelKeys.DJ_ROLE])
-
-        if dj_role is None or dj_role in interaction.user.roles:
-            return True
-
-        raise app_commands.MissingPermissions([SetupChannelKeys.DJ_ROLE_NAME])
+    async def _dispatch(
+        self,
+        interaction: discord.Interaction,
+        handler: Callable[..., Awaitable[Any]],
+        *args,
+        delete_after: float = 3,
+    ):
+        """Runs a bot action handler for the interaction and replies ephemerally."""
+        player = self.bot.get_player(interaction.guild.id)
+        msg = await handler(
+            interaction, interaction.guild, interaction.user, player, *args
+        )
+        await interaction.response.send_message(
+            msg, ephemeral=True, delete_after=delete_after
+        )
 
     @app_commands.command(
         name="setup",
@@ -72,70 +144,39 @@ class MusicCommands(commands.Cog):
         await interaction.response.send_message(msg, ephemeral=True, delete_after=5)
 
     @app_commands.command(name="play", description="Play a song with the given query.")
-    @app_commands.check(dj_role_required)
     async def play(self, interaction: discord.Interaction, query: str):
-        player = self.bot.get_player(interaction.guild.id)
-        msg = await self.bot.handle_play_action(
-            interaction, interaction.guild, interaction.user, player, query
-        )
-        await interaction.response.send_message(msg, ephemeral=True, delete_after=3)
+        await self._dispatch(interaction, self.bot.handle_play_action, query)
 
     @app_commands.command(name="stop", description="Stop playback and clear the queue.")
-    @app_commands.check(dj_role_required)
     async def stop(self, interaction: discord.Interaction):
-        player = self.bot.get_player(interaction.guild.id)
-        msg = await self.bot.handle_stop_action(
-            interaction, interaction.guild, interaction.user, player
-        )
-        await interaction.response.send_message(msg, ephemeral=True, delete_after=3)
+        await self._dispatch(interaction, self.bot.handle_stop_action)
 
     @app_commands.command(name="skip", description="Skip the current song.")
-    @app_commands.check(dj_role_required)
     @app_commands.describe(count="How many tracks to skip (default = 1)")
     async def skip(
         self,
         interaction: discord.Interaction,
         count: Optional[app_commands.Range[int, 1, None]] = 1,
     ):
-        player = self.bot.get_player(interaction.guild.id)
-        msg = await self.bot.handle_skip_action(
-            interaction, interaction.guild, interaction.user, player, count
-        )
-        await interaction.response.send_message(msg, ephemeral=True, delete_after=3)
+        await self._dispatch(interaction, self.bot.handle_skip_action, count)
 
     @app_commands.command(
         name="toggle", description="Toggle pause/resume of the current song."
     )
-    @app_commands.check(dj_role_required)
     async def pause_resume(self, interaction: discord.Interaction):
-        player = self.bot.get_player(interaction.guild.id)
-        msg = await self.bot.handle_toggle_action(
-            interaction, interaction.guild, interaction.user, player
-        )
-        await interaction.response.send_message(msg, ephemeral=True, delete_after=3)
+        await self._dispatch(interaction, self.bot.handle_toggle_action)
 
     @app_commands.command(name="disconnect", description="Disconnect the player.")
-    @app_commands.check(dj_role_required)
     async def disconnect(self, interaction: discord.Interaction):
-        player = self.bot.get_player(interaction.guild.id)
-        msg = await self.bot.handle_disconnect_action(
-            interaction, interaction.guild, interaction.user, player
-        )
-        await interaction.response.send_message(msg, ephemeral=True, delete_after=3)
+        await self._dispatch(interaction, self.bot.handle_disconnect_action)
 
     @app_commands.command(
         name="shuffle", description="Shuffle the current queue of songs."
     )
-    @app_commands.check(dj_role_required)
     async def shuffle(self, interaction: discord.Interaction):
-        player = self.bot.get_player(interaction.guild.id)
-        msg = await self.bot.handle_shuffle_action(
-            interaction, interaction.guild, interaction.user, player
-        )
-        await interaction.response.send_message(msg, ephemeral=True, delete_after=3)
+        await self._dispatch(interaction, self.bot.handle_shuffle_action)
 
     @app_commands.command(name="queue", description="Display the current queue.")
-    @app_commands.check(dj_role_required)
     @app_commands.describe(page_size="Number of songs to display per page [10-25]")
     async def queue(
         self,
@@ -157,24 +198,18 @@ class MusicCommands(commands.Cog):
     @app_commands.command(
         name="forward", description="Forward song by a given number of seconds"
     )
-    @app_commands.check(dj_role_required)
     @app_commands.describe(seconds="Number of seconds to skip forward")
     async def forward(
         self,
         interaction: discord.Interaction,
         seconds: app_commands.Range[int, 1, None],
     ):
-        player = self.bot.get_player(interaction.guild.id)
-        msg = await self.bot.handle_forward_action(
-            interaction, interaction.guild, interaction.user, player, seconds
-        )
-        await interaction.response.send_message(msg, ephemeral=True, delete_after=3)
+        await self._dispatch(interaction, self.bot.handle_forward_action, seconds)
 
     @app_commands.command(
         name="nightcore",
         description="Toggle the Nightcore effect (timescale) on or off.",
     )
-    @app_commands.check(dj_role_required)
     @app_commands.describe(mode="Toggle Nightcore effect")
     @app_commands.choices(
         mode=[
@@ -185,11 +220,7 @@ class MusicCommands(commands.Cog):
     async def nightcore(
         self, interaction: discord.Interaction, mode: app_commands.Choice[int]
     ):
-        player = self.bot.get_player(interaction.guild.id)
-        msg = await self.bot.handle_nightcore_action(
-            interaction, interaction.guild, interaction.user, player, mode.value
-        )
-        await interaction.response.send_message(msg, ephemeral=True, delete_after=3)
+        await self._dispatch(interaction, self.bot.handle_nightcore_action, mode.value)
 
     @app_commands.command(
         name="create_dj",
@@ -212,43 +243,15 @@ class MusicCommands(commands.Cog):
     @app_commands.command(
         name="247", description="Toggle 24/7 mode for the music channel."
     )
-    @app_commands.check(dj_role_required)
     async def enable_247(self, interaction: discord.Interaction):
-        player = self.bot.get_player(interaction.guild.id)
-        msg = await self.bot.handle_stay_247_action(
-            interaction, interaction.guild, interaction.user, player
-        )
-        await interaction.response.send_message(msg, ephemeral=True, delete_after=3)
+        await self._dispatch(interaction, self.bot.handle_stay_247_action)
 
     @app_commands.command(
         name="help",
         description="Get information on how to set up the music bot and usage instructions.",
     )
     async def help_command(self, interaction: discord.Interaction):
-        help_message = """
-**Music Bot Setup Help:**
-
-To set up a music request channel in your server, use the `/setup` command. This will create a dedicated channel where users can send song requests.
-        
-Once the channel is created, you can:
-- Use the `/play <song name>` command to play a song.
-- Use the `/skip [count]` command to skip the current song.
-- Use the `/toggle` command to pause or resume the song.
-- Use the `/stop` command to stop playback and clear the queue.
-- Use the `/shuffle` command to shuffle the current queue.
-- Use the `/247` command to enable or disable 24/7 mode for the music channel.
-- Use the `/nightcore` command to toggle the Nightcore effect on or off.
-- Use the `/create_dj` command to create a DJ role that can manage the music channel and commands.
-- Use the `/remove_dj` command to remove the DJ role and make the channel public.
-- Use the `/disconnect` command to disconnect the player and stop playback.
-- Use the `/forward <seconds>` command to skip forward by a given number of seconds.
-- Use the `/queue` command to display the current queue of songs.
-
-The bot will automatically manage the player and display the current song status in the setup channel.
-
-Happy listening! 🎶
-        """
-        await interaction.response.send_message(help_message, ephemeral=True)
+        await interaction.response.send_message(embed=self._help_embed, ephemeral=True)
 
 
 async def setup(bot: commands.Bot):
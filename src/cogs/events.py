@@ -4,10 +4,8 @@ import logging
 from typing import TYPE_CHECKING
 
 import discord
-from discord.ext import commands
-
 import lavalink
-from cogs.buttons import ControlButton, PlayerControlView
+from discord.ext import commands
 from lavalink.events import (
     NodeReadyEvent,
     PlayerErrorEvent,
@@ -15,11 +13,17 @@ from lavalink.events import (
     TrackStartEvent,
     TrackStuckEvent,
 )
+
+from cogs.buttons import ALL_CONTROL_BUTTONS
+from enums import SetupChannelKeys
 from utils import Error
 
 if TYPE_CHECKING:
     from music_bot import Bot
 
+# Shared presence so reconnects don't rebuild it on every on_ready.
+_READY_ACTIVITY = discord.Game(name="Playing your requests ♫")
+
 
 class EventHandlers(commands.Cog):
     """
@@ -40,9 +44,10 @@ class EventHandlers(commands.Cog):
     @commands.Cog.listener()
     async def on_ready(self):
         logging.info("Logged in: %s | %s", self.bot.user, self.bot.user.id)
-        activity = discord.Game(name="Playing your requests ♫")
         await self.bot.load_setup_message_cache()
-        await self.bot.change_presence(status=discord.Status.online, activity=activity)
+        await self.bot.change_presence(
+            status=discord.Status.online, activity=_READY_ACTIVITY
+        )
         logging.info("Bot is online & can be used ♫")
 
     @lavalink.listener(NodeReadyEvent)
@@ -61,8 +66,9 @@ class EventHandlers(commands.Cog):
         if not guild:
             return
 
-        if self.bot.latest_action and not self.bot.latest_action.get("persist", False):
-            self.bot.latest_action = None
+        latest_action = self.bot.latest_actions.get(guild.id)
+        if latest_action and not latest_action.persist:
+            del self.bot.latest_actions[guild.id]
 
         embed = self.bot.create_now_playing_embed(event.track, guild)
         await self.bot.update_setup_embed(guild=guild, player=player, embed=embed)
@@ -74,7 +80,7 @@ class EventHandlers(commands.Cog):
         if not guild:
             return
 
-        setup_data = self.bot.setup_channels.get(guild.id, {})
+        setup_data = self.bot.setup_channels.get(guild.id)
         if not setup_data:
             return
 
@@ -83,15 +89,10 @@ class EventHandlers(commands.Cog):
                 guild,
                 player,
                 embed=self.bot.create_default_embed(),
-                view=PlayerControlView(
-                    self.bot,
+                view=self.bot.get_control_view(
+                    guild.id,
                     player,
-                    disabled_buttons=[
-                        ControlButton.STOP,
-                        ControlButton.PAUSE_RESUME,
-                        ControlButton.SKIP,
-                        ControlButton.SHUFFLE,
-                    ],
+                    disabled_buttons=ALL_CONTROL_BUTTONS,
                 ),
             )
         except Exception as e:
@@ -99,17 +100,32 @@ class EventHandlers(commands.Cog):
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
-        if message.author.bot or not message.guild:
+        # Setup channels are always guild text channels, so a hit here
+        # already implies message.guild is set.
+        if message.channel.id not in self.bot.setup_channel_ids:
             return
-
-        setup_data = self.bot.setup_channels.get(message.guild.id, {})
-        if message.channel.id != setup_data.get("channel"):
+        if message.author.bot:
             return
 
         msg = await self.bot.handle_setup_play(message)
         if isinstance(msg, Error):
             await message.channel.send(msg, delete_after=5)
 
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        setup_data = self.bot.setup_channels.get(role.guild.id)
+        if not setup_data or setup_data.get(SetupChannelKeys.DJ_ROLE) != role.id:
+            return
+
+        logging.info("DJ role deleted in guild %s, forgetting it.", role.guild.id)
+        del setup_data[SetupChannelKeys.DJ_ROLE]
+        self.bot.dj_roles.pop(role.guild.id, None)
+        self.bot.schedule_setup_save()
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self.bot.forget_deleted_setup_channel(channel.guild.id, channel.id)
+
     @commands.Cog.listener()
     async def on_voice_state_update(self, member, before, after):
         await self.bot.check_voice_channel_empty_and_leave(member)
@@ -14,13 +14,12 @@ def debounce_action(delay: float = 0.5):
     def decorator(fn):
         @wraps(fn)
         async def wrapper(self, interaction, guild, user, *args, **kwargs):
-            lock = self._action_locks[guild.id]
-            if lock.locked():
+            now = asyncio.get_running_loop().time()
+            if now < self._next_action_at.get(guild.id, 0.0):
                 return Error("Too many button presses at once—please wait a moment.")
-            await lock.acquire()
+            self._next_action_at[guild.id] = now + delay
 
-            logging.debug(f"[{guild.id}] lock acquired by {user.display_name}")
-            asyncio.create_task(self._release_lock_after(lock, delay))
+            logging.debug(f"[{guild.id}] action accepted from {user.display_name}")
             return await fn(self, interaction, guild, user, *args, **kwargs)
 
         return wrapper
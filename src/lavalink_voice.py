@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import discord
-
 import lavalink
 from lavalink.errors import ClientError
 
@@ -69,4 +68,4 @@ class LavalinkVoiceClient(discord.VoiceProtocol):
         try:
             await self.lavalink.player_manager.destroy(self.guild_id)
         except ClientError:
-            pass
\ No newline at end of file
+            pass
@@ -1,4 +1,3 @@
-import asyncio
 import os
 
 from dotenv import load_dotenv
@@ -6,6 +5,12 @@ from dotenv import load_dotenv
 from enums import EnvironmentKeys
 from music_bot import Bot
 
+try:
+    # libuv-based event loop; not available on Windows.
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
 load_dotenv()
 
 bot = Bot()
@@ -18,6 +23,6 @@ async def main() -> None:
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("Bot stopped manually")
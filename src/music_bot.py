@@ -1,25 +1,27 @@
 import asyncio
+import contextlib
 import logging
 import os
 import random
 import re
-from collections import defaultdict
-from datetime import datetime, timezone
-from typing import List, cast
+import time
+from types import MappingProxyType
+from typing import Sequence, cast
 
 import discord
+import lavalink
 from discord.ext import commands
 from dotenv import load_dotenv
-
-import lavalink
-from cogs.buttons import ControlButton, PlayerControlView
-from decorators import debounce_action, ensure_voice
-from enums import EnvironmentKeys, LatestActionKeys, SetupChannelKeys
 from lavalink import LoadType
 from lavalink.filters import Timescale
+
+from cogs.buttons import ALL_CONTROL_BUTTONS, ControlButton, PlayerControlView
+from decorators import debounce_action, ensure_voice
+from enums import EnvironmentKeys, SetupChannelKeys
 from lavalink_voice import LavalinkVoiceClient
 from utils import (
     Error,
+    LatestAction,
     Success,
     format_duration,
     load_setup_channels,
@@ -29,6 +31,77 @@ from utils import (
 
 load_dotenv()
 URL_RX = re.compile(r"https?://(?:www\.)?.+")
+LOG_LEVEL = (
+    logging.DEBUG
+    if os.getenv(EnvironmentKeys.LOG_LEVEL, "info").lower() == "debug"
+    else logging.INFO
+)
+
+# Channel permission overwrites are only read by discord.py, so they can be shared.
+BOT_OVERWRITE = discord.PermissionOverwrite(
+    view_channel=True,
+    send_messages=True,
+    read_message_history=True,
+    manage_messages=True,
+    embed_links=True,
+)
+PUBLIC_OVERWRITE = discord.PermissionOverwrite(
+    send_messages=True,
+    read_messages=True,
+    manage_messages=False,
+    embed_links=False,
+)
+HIDDEN_OVERWRITE = discord.PermissionOverwrite(view_channel=False)
+DJ_OVERWRITE = discord.PermissionOverwrite(
+    view_channel=True,
+    send_messages=True,
+    manage_messages=True,
+    embed_links=True,
+)
+
+# Upper bound on setup message fetches in flight while warming the cache.
+SETUP_FETCH_CONCURRENCY = 10
+
+# Edited setup messages older than this (seconds) are replaced on the next update.
+SETUP_MESSAGE_MAX_AGE = 3600
+
+# How long background setup embed updates wait to absorb follow-up actions.
+SETUP_EMBED_COALESCE_DELAY = 0.15
+
+# Read-only fallback for guilds without a setup entry, so lookups don't
+# allocate a fresh dict each time.
+_NO_SETUP = MappingProxyType({})
+
+
+def _snowflake_timestamp(snowflake: int) -> float:
+    """Returns the POSIX creation time encoded in a Discord ID."""
+    return ((snowflake >> 22) + discord.utils.DISCORD_EPOCH) / 1000
+
+
+# Permissions the setup message needs: editing (and fetching) it, and sending
+# a replacement when it has to be resent.
+_SETUP_EDIT_PERMS = ("view_channel", "embed_links", "read_message_history")
+_SETUP_PERMS = (*_SETUP_EDIT_PERMS, "send_messages")
+
+
+def _setup_message_fingerprint(embed: discord.Embed, view: discord.ui.View) -> int:
+    """Hashes what the setup message shows, to detect edits that change nothing."""
+    return hash(
+        (
+            embed.title,
+            embed.description,
+            embed.url,
+            embed.author.name,
+            embed.image.url,
+            embed.footer.text,
+            tuple(field.value for field in embed.fields),
+            tuple(
+                (child.custom_id, child.disabled, str(child.emoji))
+                for child in view.children
+                if isinstance(child, discord.ui.Button)
+            ),
+        )
+    )
 
 
 class Bot(commands.Bot):
@@ -36,12 +109,7 @@ class Bot(commands.Bot):
         intents = discord.Intents.default()
         intents.message_content = True
         intents.guilds = True
-        logging_level = (
-            logging.DEBUG
-            if os.getenv(EnvironmentKeys.LOG_LEVEL).lower() == "debug"
-            else logging.INFO
-        )
-        discord.utils.setup_logging(level=logging_level)
+        discord.utils.setup_logging(level=LOG_LEVEL)
 
         super().__init__(
             command_prefix="!",
@@ -50,25 +118,87 @@ class Bot(commands.Bot):
         )
 
         self.setup_channels = load_setup_channels()
-        self.latest_action: dict | None = None
+        # Index of setup channel IDs so on_message can reject other channels cheaply.
+        self.setup_channel_ids: set[int] = {
+            data[SetupChannelKeys.CHANNEL]
+            for data in self.setup_channels.values()
+            if SetupChannelKeys.CHANNEL in data
+        }
+        # Latest user action per guild, shown in the footer of its next setup embed update.
+        self.latest_actions: dict[int, LatestAction] = {}
         self.delete_message_tags: set[int] = set()
         self.setup_message_cache: dict[int, discord.Message] = {}
+        self.setup_channel_cache: dict[int, discord.TextChannel] = {}
+        self.control_views: dict[int, PlayerControlView] = {}
+        self._default_embed: discord.Embed | None = None
         self.dj_roles: dict[int, discord.Role] = {}
-        self._action_locks: dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Per-guild loop time before which further actions are rejected.
+        self._next_action_at: dict[int, float] = {}
         self.lavalink: lavalink.Client | None = None
-
-    def set_latest_action(self, action: str, persist: bool = False):
+        self._setup_dirty = asyncio.Event()
+        self._setup_writer_task: asyncio.Task | None = None
+        # Serializes writes of setup_channels so two never share the tmp file.
+        self._setup_save_lock = asyncio.Lock()
+        self._setup_embed_locks: dict[int, asyncio.Lock] = {}
+        # (message ID, fingerprint) of the last content written to each setup message.
+        self._setup_message_state: dict[int, tuple[int, int]] = {}
+        # Guilds with a background embed update waiting to run.
+        self._pending_embed_updates: set[int] = set()
+        # Setup message permissions last reported missing, per setup channel.
+        self._setup_channel_missing_perms: dict[int, frozenset[str]] = {}
+
+        # Environment-driven settings used on every embed/playback, resolved once.
+        self.now_playing_icon_url = os.getenv(EnvironmentKeys.NOW_PLAYING_SPIN_GIF_URL)
+        self.no_song_image_url = os.getenv(EnvironmentKeys.NO_SONG_PLAYING_IMAGE_URL)
+        self.bot_volume = int(os.getenv(EnvironmentKeys.BOT_VOLUME, "100"))
+
+    def set_latest_action(self, guild_id: int, action: str, persist: bool = False):
         """
-        Sets the latest user action for display in embeds.
+        Sets the latest user action in a guild for display in its setup embed.
 
         Parameters:
+            guild_id (int): The guild the action happened in.
             action (str): The action message (e.g., "Skipped by User").
             persist (bool): Whether to persist the action message on the next embed update.
         """
-        self.latest_action = {
-            LatestActionKeys.TEXT: action,
-            LatestActionKeys.PERSIST: persist,
+        self.latest_actions[guild_id] = LatestAction(action, persist)
+
+    def schedule_setup_save(self) -> None:
+        """
+        Marks setup_channels as changed. The background writer coalesces
+        bursts of changes into a single write to disk.
+        """
+        self._setup_dirty.set()
+
+    async def _setup_channels_writer(self, delay: float = 1.0) -> None:
+        """Writes setup_channels to disk at most once per `delay` seconds."""
+        while True:
+            await self._setup_dirty.wait()
+            await asyncio.sleep(delay)
+            self._setup_dirty.clear()
+            # Shielded: cancelling the writer must not abandon a write whose
+            # thread keeps running and would race the final save in close().
+            await asyncio.shield(self._save_setup_channels())
+
+    async def _save_setup_channels(self) -> None:
+        snapshot = {
+            guild_id: dict(data) for guild_id, data in self.setup_channels.items()
         }
+        async with self._setup_save_lock:
+            try:
+                await save_setup_channels_async(snapshot)
+            except Exception as e:
+                logging.error("Failed to save setup channels: %s", e)
+
+    async def close(self) -> None:
+        if self._setup_writer_task:
+            self._setup_writer_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._setup_writer_task
+        if self._setup_dirty.is_set():
+            self._setup_dirty.clear()
+            await self._save_setup_channels()
+        await super().close()
 
     async def setup_hook(self):
         """
@@ -113,6 +243,8 @@ class Bot(commands.Bot):
             ssl=ssl_enabled,
         )
 
+        self._setup_writer_task = asyncio.create_task(self._setup_channels_writer())
+
         await self.load_extension("cogs.commands")
         await self.load_extension("cogs.events")
         await self.tree.sync()
@@ -124,59 +256,133 @@ class Bot(commands.Bot):
             lavalink.DefaultPlayer | None, self.lavalink.player_manager.get(guild_id)
         )
 
+    def get_control_view(
+        self,
+        guild_id: int,
+        player: lavalink.DefaultPlayer | None,
+        disabled_buttons: Sequence[ControlButton] | None = None,
+    ) -> PlayerControlView:
+        """
+        Returns the guild's cached PlayerControlView, updated in place for the
+        given player state. A new view is only created the first time.
+        """
+        view = self.control_views.get(guild_id)
+        if view is None:
+            view = PlayerControlView(self, player, disabled_buttons)
+            self.control_views[guild_id] = view
+            return view
+        return view.update_state(player, disabled_buttons)
+
+    def get_setup_channel(self, guild: discord.Guild) -> discord.TextChannel | None:
+        """
+        Returns the guild's setup channel, resolving and caching it on first use.
+        discord.py updates channel objects in place, so the cached object only
+        needs to be dropped when the channel is deleted or replaced.
+        """
+        channel = self.setup_channel_cache.get(guild.id)
+        if channel is not None:
+            return channel
+
+        channel_id = self.setup_channels.get(guild.id, _NO_SETUP).get(
+            SetupChannelKeys.CHANNEL
+        )
+        if channel_id is None:
+            return None
+        channel = guild.get_channel(channel_id)
+        if channel is not None:
+            self.setup_channel_cache[guild.id] = channel
+        return channel
+
+    def _forget_setup_channel(self, guild_id: int) -> None:
+        """Removes the guild's setup entry and its channel from the ID index."""
+        self.setup_channel_cache.pop(guild_id, None)
+        self._setup_embed_locks.pop(guild_id, None)
+        self._setup_message_state.pop(guild_id, None)
+        channel_id = self.setup_channels.get(guild_id, _NO_SETUP).get(
+            SetupChannelKeys.CHANNEL
+        )
+        self.setup_channel_ids.discard(channel_id)
+        self._setup_channel_missing_perms.pop(channel_id, None)
+        if remove_setup_channel(guild_id, self.setup_channels):
+            self.schedule_setup_save()
+
+    def forget_deleted_setup_channel(self, guild_id: int, channel_id: int) -> None:
+        """
+        Drops everything tied to a deleted setup channel. The guild's setup
+        entry is kept so its DJ role and 24/7 settings survive a new /setup.
+        """
+        if (
+            self.setup_channels.get(guild_id, _NO_SETUP).get(SetupChannelKeys.CHANNEL)
+            != channel_id
+        ):
+            return
+        self.setup_channel_ids.discard(channel_id)
+        self.setup_channel_cache.pop(guild_id, None)
+        self.setup_message_cache.pop(guild_id, None)
+        self._setup_message_state.pop(guild_id, None)
+        self._setup_channel_missing_perms.pop(channel_id, None)
+
     async def load_setup_message_cache(self) -> None:
         """
         Loads and caches the setup messages for each guild from the stored setup_channels.
         If the setup channel isn't found or an error occurs while fetching the message,
         the guild's entry is removed from both the in-memory setup_channels and the local file.
         Also loads the DJ role (if stored) into self.dj_roles.
+        Guilds are loaded concurrently, with at most SETUP_FETCH_CONCURRENCY
+        message fetches in flight at once.
         """
-        guild_count = len(self.setup_channels)
-        delay = 0.02 if guild_count > 50 else 0
+        semaphore = asyncio.Semaphore(SETUP_FETCH_CONCURRENCY)
+        await asyncio.gather(
+            *(
+                self._load_setup_message(guild_id, data, semaphore)
+                for guild_id, data in list(self.setup_channels.items())
+            )
+        )
 
-        for guild_id, data in list(self.setup_channels.items()):
-            channel_id = data.get(SetupChannelKeys.CHANNEL)
-            message_id = data.get(SetupChannelKeys.MESSAGE)
-            guild = self.get_guild(guild_id)
-            if not guild:
-                logging.warning(
-                    f"Guild {guild_id} not found. Removing from setup_channels."
-                )
-                remove_setup_channel(guild_id, self.setup_channels)
-                continue
+    async def _load_setup_message(
+        self, guild_id: int, data: dict, semaphore: asyncio.Semaphore
+    ) -> None:
+        channel_id = data.get(SetupChannelKeys.CHANNEL)
+        message_id = data.get(SetupChannelKeys.MESSAGE)
+        guild = self.get_guild(guild_id)
+        if not guild:
+            logging.warning(
+                f"Guild {guild_id} not found. Removing from setup_channels."
+            )
+            self._forget_setup_channel(guild_id)
+            return
 
-            channel = guild.get_channel(channel_id)
-            if not channel:
-                logging.warning(
-                    f"Channel {channel_id} not found in guild {guild_id}. Removing from setup_channels."
-                )
-                remove_setup_channel(guild_id, self.setup_channels)
-                continue
+        channel = self.get_setup_channel(guild)
+        if not channel:
+            logging.warning(
+                f"Channel {channel_id} not found in guild {guild_id}. Removing from setup_channels."
+            )
+            self._forget_setup_channel(guild_id)
+            return
 
-            try:
+        try:
+            async with semaphore:
                 msg = await channel.fetch_message(message_id)
-                self.setup_message_cache[guild_id] = msg
-                logging.info(f"Cached setup message for guild {guild_id}.")
-            except Exception as e:
+            self.setup_message_cache[guild_id] = msg
+            logging.info(f"Cached setup message for guild {guild_id}.")
+        except Exception as e:
+            logging.warning(
+                f"Error fetching setup message for guild {guild_id}: {e}. Removing from setup_channels."
+            )
+            self._forget_setup_channel(guild_id)
+            return
+
+        if SetupChannelKeys.DJ_ROLE in data:
+            role_id = data.get(SetupChannelKeys.DJ_ROLE)
+            dj_role = guild.get_role(role_id)
+            if dj_role:
+                self.dj_roles[guild_id] = dj_role
+            else:
                 logging.warning(
-                    f"Error fetching setup message for guild {guild_id}: {e}. Removing from setup_channels."
+                    f"DJ role with ID {role_id} not found in guild {guild_id}. Removing from setup_channels."
                 )
-                remove_setup_channel(guild_id, self.setup_channels)
-                continue
-
-            if SetupChannelKeys.DJ_ROLE in data:
-                role_id = data.get(SetupChannelKeys.DJ_ROLE)
-                dj_role = guild.get_role(role_id)
-                if dj_role:
-                    self.dj_roles[guild_id] = dj_role
-                else:
-                    logging.warning(
-                        f"DJ role with ID {role_id} not found in guild {guild_id}. Removing from setup_channels."
-                    )
-                    del data[SetupChannelKeys.DJ_ROLE]
-                    asyncio.create_task(save_setup_channels_async(self.setup_channels))
-            if delay:
-                await asyncio.sleep(delay)
+                del data[SetupChannelKeys.DJ_ROLE]
+                self.schedule_setup_save()
 
     async def create_setup_channel(self, guild: discord.Guild) -> str:
         """
@@ -185,54 +391,41 @@ class Bot(commands.Bot):
         updates the in-memory dictionary, the message cache, and persistent storage,
         and returns a message string that the caller (commands) can display.
         """
-        overwrites = {
-            guild.me: discord.PermissionOverwrite(
-                view_channel=True,
-                send_messages=True,
-                read_message_history=True,
-                manage_messages=True,
-                embed_links=True,
-            ),
-            guild.default_role: discord.PermissionOverwrite(
-                send_messages=True,
-                read_messages=True,
-                manage_messages=False,
-                embed_links=False,
-            ),
-        }
+        # Apply the DJ restrictions as part of channel creation instead of
+        # patching them in with extra requests afterwards.
+        dj_role = self.dj_roles.get(guild.id)
+        if dj_role:
+            overwrites = {
+                guild.me: BOT_OVERWRITE,
+                guild.default_role: HIDDEN_OVERWRITE,
+                dj_role: DJ_OVERWRITE,
+            }
+        else:
+            overwrites = {
+                guild.me: BOT_OVERWRITE,
+                guild.default_role: PUBLIC_OVERWRITE,
+            }
+        embed = self.create_default_embed()
+        # A fresh view: the guild's cached one is still live on the current
+        # setup message and must keep working if creating the channel fails.
+        view = PlayerControlView(self, None)
 
         try:
             channel = await guild.create_text_channel(
                 name="🎧song-requests", overwrites=overwrites, slowmode_delay=2
             )
-            embed = self.create_default_embed()
-            view = PlayerControlView(self, None)
             status_message = await channel.send(embed=embed, view=view)
+            self.control_views[guild.id] = view
             data = self.setup_channels.get(guild.id, {})
+            self.setup_channel_ids.discard(data.get(SetupChannelKeys.CHANNEL))
+            self.setup_channel_ids.add(channel.id)
+            self.setup_channel_cache[guild.id] = channel
             data[SetupChannelKeys.CHANNEL] = channel.id
             data[SetupChannelKeys.MESSAGE] = status_message.id
             self.setup_channels[guild.id] = data
-            asyncio.create_task(save_setup_channels_async(self.setup_channels))
+            self.schedule_setup_save()
             self.setup_message_cache[guild.id] = status_message
 
-            dj_role = self.dj_roles.get(guild.id)
-            if dj_role:
-                await channel.set_permissions(
-                    guild.default_role,
-                    overwrite=discord.PermissionOverwrite(view_channel=False),
-                )
-
-                dj_overwrites = discord.PermissionOverwrite(
-                    view_channel=True,
-                    send_messages=True,
-                    manage_messages=True,
-                    embed_links=True,
-                )
-                await channel.set_permissions(dj_role, overwrite=dj_overwrites)
-                logging.info(
-                    f"Updated permissions for existing DJ role in guild {guild.id}."
-                )
-
             return f"Music channel created: {channel.mention}"
         except discord.Forbidden:
             return "I need the following permissions: `Connect`, `Embed Links`, `Manage Channels`, `Manage Messages`, `Manage Roles`, `Send Messages`, `Speak` and `View Channels`."
@@ -245,41 +438,35 @@ class Bot(commands.Bot):
         )
         embed.set_author(
             name="Now Playing",
-            icon_url=os.getenv(EnvironmentKeys.NOW_PLAYING_SPIN_GIF_URL),
-        )
-        requester_id = getattr(track, "requester", None)
-        requester = (
-            guild.get_member(requester_id) if isinstance(requester_id, int) else None
+            icon_url=self.now_playing_icon_url,
         )
+        # AudioTrack.requester is always set (0 when nobody requested it).
+        requester = guild.get_member(track.requester) if track.requester else None
         embed.add_field(
             name="Requested by",
             value=requester.mention if requester else "Unknown",
             inline=True,
         )
-        duration_ms = getattr(track, "duration", getattr(track, "length", 0))
-        is_stream = bool(getattr(track, "stream", False))
-        duration = format_duration(duration_ms) if not is_stream else "Live"
+        duration = format_duration(track.duration) if not track.stream else "Live"
         embed.add_field(name="Duration", value=duration, inline=True)
-        artwork = getattr(track, "artwork_url", None) or getattr(
-            track, "artworkUrl", None
-        )
-        if artwork:
-            embed.set_image(url=artwork)
+        if track.artwork_url:
+            embed.set_image(url=track.artwork_url)
         else:
-            embed.set_image(url=os.getenv(EnvironmentKeys.NO_SONG_PLAYING_IMAGE_URL))
-        if self.latest_action:
-            embed.set_footer(text=self.latest_action[LatestActionKeys.TEXT])
-            self.latest_action = None
+            embed.set_image(url=self.no_song_image_url)
         return embed
 
     def create_default_embed(self) -> discord.Embed:
-        embed = discord.Embed(
-            title="Now Playing", description="No song currently playing"
-        )
-        embed.set_image(url=os.getenv(EnvironmentKeys.NO_SONG_PLAYING_IMAGE_URL))
-        if self.latest_action:
-            embed.set_footer(text=self.latest_action[LatestActionKeys.TEXT])
-        return embed
+        """
+        Returns a copy of the idle "No song currently playing" embed.
+        The embed is built once; callers get a copy since the footer is
+        set per update.
+        """
+        if self._default_embed is None:
+            self._default_embed = discord.Embed(
+                title="Now Playing", description="No song currently playing"
+            )
+            self._default_embed.set_image(url=self.no_song_image_url)
+        return self._default_embed.copy()
 
     async def voice_precheck(
         self,
@@ -325,25 +512,16 @@ class Bot(commands.Bot):
 
         setup_data[SetupChannelKeys.DJ_ROLE] = dj_role.id
         self.setup_channels[guild.id] = setup_data
-        asyncio.create_task(save_setup_channels_async(self.setup_channels))
+        self.schedule_setup_save()
         self.dj_roles[guild.id] = dj_role
 
-        channel_id = setup_data.get(SetupChannelKeys.CHANNEL)
-        if channel_id:
-            channel = guild.get_channel(channel_id)
-            if channel:
-                await channel.set_permissions(
-                    guild.default_role,
-                    overwrite=discord.PermissionOverwrite(view_channel=False),
-                )
-
-                dj_overwrites = discord.PermissionOverwrite(
-                    view_channel=True,
-                    send_messages=True,
-                    manage_messages=True,
-                    embed_links=True,
-                )
-                await channel.set_permissions(dj_role, overwrite=dj_overwrites)
+        channel = self.get_setup_channel(guild)
+        if channel:
+            # The two overwrites are independent requests, so send them together.
+            await asyncio.gather(
+                channel.set_permissions(guild.default_role, overwrite=HIDDEN_OVERWRITE),
+                channel.set_permissions(dj_role, overwrite=DJ_OVERWRITE),
+            )
 
         return f"DJ role created successfully: {dj_role.mention}"
 
@@ -370,24 +548,16 @@ class Bot(commands.Bot):
         if SetupChannelKeys.DJ_ROLE in setup_data:
             del setup_data[SetupChannelKeys.DJ_ROLE]
             self.setup_channels[guild.id] = setup_data
-            asyncio.create_task(save_setup_channels_async(self.setup_channels))
+            self.schedule_setup_save()
 
-        channel_id = setup_data.get(SetupChannelKeys.CHANNEL)
-        if channel_id:
-            channel = guild.get_channel(channel_id)
-            if channel:
-                try:
-                    default_overwrite = discord.PermissionOverwrite(
-                        send_messages=True,
-                        read_messages=True,
-                        manage_messages=False,
-                        embed_links=False,
-                    )
-                    await channel.set_permissions(
-                        guild.default_role, overwrite=default_overwrite
-                    )
-                except Exception as e:
-                    return f"DJ role removed, but failed to update channel permissions: {e}"
+        channel = self.get_setup_channel(guild)
+        if channel:
+            try:
+                await channel.set_permissions(
+                    guild.default_role, overwrite=PUBLIC_OVERWRITE
+                )
+            except Exception as e:
+                return f"DJ role removed, but failed to update channel permissions: {e}"
 
         return "DJ role removed. The music channel is now public for everyone."
 
@@ -410,12 +580,6 @@ class Bot(commands.Bot):
             message.content,
         )
 
-    async def _release_lock_after(self, lock: asyncio.Lock, delay: float):
-        await asyncio.sleep(delay)
-        if lock.locked():
-            lock.release()
-            logging.debug(f"Lock released after {delay} seconds.")
-
     @ensure_voice
     @debounce_action(delay=0.1)
     async def handle_play_action(
@@ -426,36 +590,41 @@ class Bot(commands.Bot):
         player: lavalink.DefaultPlayer | None,
         query: str,
     ) -> str:
-        if not guild.voice_client:
-            try:
-                await user.voice.channel.connect(cls=LavalinkVoiceClient)
-            except Exception as e:
-                logging.error("Voice connection failed: %s", e)
-                return Error("🚫 Could not join your voice channel.")
-
         if not self.lavalink:
             return Error("Lavalink client is not initialized.")
 
-        player = self.get_player(guild.id) or cast(
-            lavalink.DefaultPlayer, self.lavalink.player_manager.create(guild.id)
-        )
-
         query = query.strip("<>")
         if not URL_RX.match(query):
             query = f"ytsearch:{query}"
 
-        try:
-            results = await self.lavalink.get_tracks(query)
-        except Exception as e:
-            logging.error("Search failed: %s", e)
+        # The voice connect and the track search are independent round-trips,
+        # so run them concurrently.
+        pending = [self.lavalink.get_tracks(query)]
+        if not guild.voice_client:
+            pending.append(user.voice.channel.connect(cls=LavalinkVoiceClient))
+        results, *connected = await asyncio.gather(*pending, return_exceptions=True)
+
+        if connected and isinstance(connected[0], BaseException):
+            logging.error("Voice connection failed: %s", connected[0])
+            return Error("🚫 Could not join your voice channel.")
+        if isinstance(results, BaseException):
+            logging.error("Search failed: %s", results)
             return Error("🔍 Could not search for that track.")
 
+        player = self.get_player(guild.id) or cast(
+            lavalink.DefaultPlayer, self.lavalink.player_manager.create(guild.id)
+        )
+
         if not results or not results.tracks:
             return Error("❌ No results found for that query.")
 
         if results.load_type == LoadType.PLAYLIST:
+            # Tag the whole playlist and append it in one go rather than
+            # going through player.add() per track.
+            requester = user.id
             for track in results.tracks:
-                player.add(track, requester=user.id)
+                track.requester = requester
+            player.queue.extend(results.tracks)
             playlist_name = getattr(results.playlist_info, "name", "playlist")
             msg = f"Added playlist **`{playlist_name}`** to the queue."
         else:
@@ -464,10 +633,10 @@ class Bot(commands.Bot):
             msg = f"Added **`{track.title}`** to the queue."
 
         if not player.is_playing:
-            await player.play(volume=int(os.getenv(EnvironmentKeys.BOT_VOLUME, "100")))
+            await player.play(volume=self.bot_volume)
 
         asyncio.create_task(
-            self.update_setup_buttons(guild, PlayerControlView(self, player))
+            self.update_setup_buttons(guild, self.get_control_view(guild.id, player))
         )
 
         return Success(msg)
@@ -488,7 +657,9 @@ class Bot(commands.Bot):
             return Error("No active player.")
 
         try:
-            self.set_latest_action(f"Stopped by {user.display_name}", persist=True)
+            self.set_latest_action(
+                guild.id, f"Stopped by {user.display_name}", persist=True
+            )
             player.queue.clear()
             await player.stop()
 
@@ -496,15 +667,10 @@ class Bot(commands.Bot):
                 guild,
                 player,
                 embed=self.create_default_embed(),
-                view=PlayerControlView(
-                    self,
+                view=self.get_control_view(
+                    guild.id,
                     player,
-                    disabled_buttons=[
-                        ControlButton.STOP,
-                        ControlButton.PAUSE_RESUME,
-                        ControlButton.SKIP,
-                        ControlButton.SHUFFLE,
-                    ],
+                    disabled_buttons=ALL_CONTROL_BUTTONS,
                 ),
             )
 
@@ -530,16 +696,14 @@ class Bot(commands.Bot):
                 f"Cannot skip {count} tracks; only {len(player.queue)} in the queue."
             )
         if count > 1:
-            for _ in range(count - 1):
-                try:
-                    player.queue.pop(0)
-                except (IndexError, AttributeError):
-                    break
+            del player.queue[: count - 1]
 
         try:
-            self.set_latest_action(f"Skipped by {user.display_name}", persist=True)
+            self.set_latest_action(
+                guild.id, f"Skipped by {user.display_name}", persist=True
+            )
             await player.skip()
-            return Success(f"⏭️ Skipped {count} track{'s' if count>1 else ''}.")
+            return Success(f"⏭️ Skipped {count} track{'s' if count > 1 else ''}.")
         except Exception as e:
             logging.error("Skip error", exc_info=e)
             return Error("Failed to skip.")
@@ -564,8 +728,8 @@ class Bot(commands.Bot):
             return Error("Failed to toggle pause/resume.")
 
         action = "Paused" if new_pause_state else "Resumed"
-        self.set_latest_action(f"{action} by {user.display_name}")
-        await self.update_setup_embed(guild, player)
+        self.set_latest_action(guild.id, f"{action} by {user.display_name}")
+        self.schedule_setup_embed_update(guild, player)
         return Success(f"{action} the current track.")
 
     async def handle_disconnect_action(
@@ -578,7 +742,7 @@ class Bot(commands.Bot):
         if not guild.voice_client:
             return Error("🚫 I’m not connected to any voice channel.")
         try:
-            self.set_latest_action(f"Disconnected by {user.display_name}")
+            self.set_latest_action(guild.id, f"Disconnected by {user.display_name}")
             active_player = player or self.get_player(guild.id)
             if active_player:
                 active_player.queue.clear()
@@ -593,15 +757,10 @@ class Bot(commands.Bot):
             guild,
             player,
             embed=self.create_default_embed(),
-            view=PlayerControlView(
-                self,
+            view=self.get_control_view(
+                guild.id,
                 player,
-                disabled_buttons=[
-                    ControlButton.STOP,
-                    ControlButton.PAUSE_RESUME,
-                    ControlButton.SKIP,
-                    ControlButton.SHUFFLE,
-                ],
+                disabled_buttons=ALL_CONTROL_BUTTONS,
             ),
         )
 
@@ -619,8 +778,8 @@ class Bot(commands.Bot):
             return Error("No active player or the queue is empty.")
         try:
             random.shuffle(player.queue)
-            self.set_latest_action(f"Shuffled by {user.display_name}")
-            await self.update_setup_embed(guild, player)
+            self.set_latest_action(guild.id, f"Shuffled by {user.display_name}")
+            self.schedule_setup_embed_update(guild, player)
             return Success("The queue has been shuffled!")
         except Exception as e:
             logging.error(f"Shuffle error: {e}")
@@ -637,8 +796,9 @@ class Bot(commands.Bot):
         if not player or not player.queue:
             return Error("The queue is empty.")
 
-        tracks = list(player.queue)
-        view = QueueView(interaction.user, tracks, page_size)
+        # Snapshot the queue so every page is cut from the same list; the copy
+        # only holds references to the tracks.
+        view = QueueView(interaction.user, tuple(player.queue), page_size)
         embed = view.current_embed()
         return embed, view
 
@@ -662,9 +822,9 @@ class Bot(commands.Bot):
         try:
             await player.seek(new_pos)
             self.set_latest_action(
-                f"Forwarded {seconds}s by {user.display_name}", persist=True
+                guild.id, f"Forwarded {seconds}s by {user.display_name}", persist=True
             )
-            await self.update_setup_embed(guild, player)
+            self.schedule_setup_embed_update(guild, player)
             return Success(f"⏩ Forwarded {seconds} seconds.")
         except Exception as e:
             logging.error(f"Forward error: {e}")
@@ -682,17 +842,29 @@ class Bot(commands.Bot):
         if not player:
             return Error("No active player.")
 
+        # Timescale is only ever applied by nightcore, so its presence on the
+        # player is the current state; skip the Lavalink update when unchanged.
+        enabled = player.get_filter(Timescale) is not None
+        if enabled == bool(mode):
+            return Success(
+                "Nightcore effect is already enabled."
+                if enabled
+                else "Nightcore effect is already disabled."
+            )
+
         try:
             if mode == 0:
                 await player.remove_filter(Timescale)
-                self.set_latest_action(f"Nightcore OFF by {user.display_name}")
+                self.set_latest_action(
+                    guild.id, f"Nightcore OFF by {user.display_name}"
+                )
                 msg = "Nightcore effect disabled."
             else:
                 await player.update_filter(Timescale, pitch=1.2, speed=1.1, rate=1.0)
-                self.set_latest_action(f"Nightcore ON by {user.display_name}")
+                self.set_latest_action(guild.id, f"Nightcore ON by {user.display_name}")
                 msg = "Nightcore effect enabled!"
 
-            await self.update_setup_embed(guild, player)
+            self.schedule_setup_embed_update(guild, player)
             return Success(msg)
         except Exception as e:
             logging.error(f"Filter update error: {e}")
@@ -711,7 +883,7 @@ class Bot(commands.Bot):
         new_value = not current
         setup_data[SetupChannelKeys.STAY_247] = new_value
 
-        asyncio.create_task(save_setup_channels_async(self.setup_channels))
+        self.schedule_setup_save()
 
         await self.check_voice_channel_empty_and_leave(user)
 
@@ -726,12 +898,12 @@ class Bot(commands.Bot):
         if member.bot:
             return
 
-        non_bots = [m for m in vc.channel.members if not m.bot]
-        if non_bots:
+        # Stop at the first listener instead of building the member list.
+        if any(not m.bot for m in vc.channel.members):
             return
 
         guild = member.guild
-        stay = self.setup_channels.get(guild.id, {}).get(
+        stay = self.setup_channels.get(guild.id, _NO_SETUP).get(
             SetupChannelKeys.STAY_247, False
         )
 
@@ -743,19 +915,38 @@ class Bot(commands.Bot):
                     guild,
                     player,
                     embed=self.create_default_embed(),
-                    view=PlayerControlView(
-                        self,
+                    view=self.get_control_view(
+                        guild.id,
                         player,
-                        disabled_buttons=[
-                            ControlButton.STOP,
-                            ControlButton.PAUSE_RESUME,
-                            ControlButton.SKIP,
-                            ControlButton.SHUFFLE,
-                        ],
+                        disabled_buttons=ALL_CONTROL_BUTTONS,
                     ),
                 )
             await vc.disconnect()
 
+    def schedule_setup_embed_update(
+        self, guild: discord.Guild, player: lavalink.DefaultPlayer | None
+    ) -> None:
+        """
+        Updates the setup embed in the background so the caller can respond to
+        the interaction without waiting on the message edit. Requests arriving
+        while an update is still pending are folded into it, since the update
+        reads the player state and the guild's latest action only when it runs.
+        """
+        if guild.id in self._pending_embed_updates:
+            return
+        self._pending_embed_updates.add(guild.id)
+        asyncio.create_task(self._flush_setup_embed_update(guild, player))
+
+    async def _flush_setup_embed_update(
+        self,
+        guild: discord.Guild,
+        player: lavalink.DefaultPlayer | None,
+        delay: float = SETUP_EMBED_COALESCE_DELAY,
+    ) -> None:
+        await asyncio.sleep(delay)
+        self._pending_embed_updates.discard(guild.id)
+        await self.update_setup_embed(guild, player)
+
     async def update_setup_embed(
         self,
         guild: discord.Guild,
@@ -766,74 +957,98 @@ class Bot(commands.Bot):
         """
         Updates the embed and view in the setup channel using the cached setup message.
         This avoids duplicate API calls by referencing the cached message.
+        Edits to the same guild's setup message run one at a time so they land
+        in order.
         """
+        async with self._setup_message_lock(guild.id):
+            await self._update_setup_embed(guild, player, view, embed)
+
+    def _setup_message_lock(self, guild_id: int) -> asyncio.Lock:
+        """Returns the lock serializing edits to the guild's setup message."""
+        lock = self._setup_embed_locks.get(guild_id)
+        if lock is None:
+            lock = self._setup_embed_locks[guild_id] = asyncio.Lock()
+        return lock
+
+    async def _update_setup_embed(
+        self,
+        guild: discord.Guild,
+        player: lavalink.DefaultPlayer | None,
+        view: discord.ui.View | None,
+        embed: discord.Embed | None,
+    ) -> None:
         setup_data = self.setup_channels.get(guild.id)
         if not setup_data:
             return
 
         channel_id = setup_data.get(SetupChannelKeys.CHANNEL)
         message_id = setup_data.get(SetupChannelKeys.MESSAGE)
-        channel = guild.get_channel(channel_id)
+        channel = self.get_setup_channel(guild)
         if channel is None:
             logging.warning("Channel %s not found for guild %s", channel_id, guild.id)
+            self.latest_actions.pop(guild.id, None)
             return
 
-        embed = await self._fetch_or_create_embed(channel, message_id, embed)
-        view = view or PlayerControlView(self, player)
-        new_message_id, edited, original_message = (
-            await self._update_or_replace_message(channel, message_id, embed, view)
+        # Checked locally so a misconfigured channel doesn't cost a failing
+        # REST call (and an error log) on every update.
+        perms = channel.permissions_for(guild.me)
+        self._report_missing_setup_perms(channel, perms)
+        if not all(getattr(perms, name) for name in _SETUP_EDIT_PERMS):
+            self.latest_actions.pop(guild.id, None)
+            return
+
+        view = view or self.get_control_view(guild.id, player)
+        new_message_id, edited, _ = await self._sync_setup_message(
+            channel, message_id, embed, view, can_send=perms.send_messages
         )
-        setup_data[SetupChannelKeys.MESSAGE] = new_message_id
-        asyncio.create_task(save_setup_channels_async(self.setup_channels))
+        # Only a resent message changes the ID; edits and skipped updates
+        # leave setup_channels as it is on disk.
+        if new_message_id != message_id:
+            setup_data[SetupChannelKeys.MESSAGE] = new_message_id
+            self.schedule_setup_save()
 
         if (
             edited
-            and original_message
-            and (
-                (
-                    datetime.now(timezone.utc) - original_message.created_at
-                ).total_seconds()
-                > 3600
-            )
+            and time.time() - _snowflake_timestamp(new_message_id)
+            > SETUP_MESSAGE_MAX_AGE
         ):
             self.delete_message_tags.add(new_message_id)
-        self.set_latest_action("")
+        self.latest_actions.pop(guild.id, None)
 
-    async def _fetch_or_create_embed(
-        self, channel: discord.TextChannel, message_id: int, embed: discord.Embed | None = None
-    ) -> discord.Embed:
-        """
-        Attempts to retrieve the embed from a cached message.
-        If not available, fetches the message, caches it, and returns its embed.
-        If the message has no embed or an error occurs, returns a default embed.
-        """
-        guild_id = channel.guild.id
-        message = self.setup_message_cache.get(guild_id)
-        if message is None:
-            try:
-                message = await channel.fetch_message(message_id)
-                self.setup_message_cache[guild_id] = message
-                logging.info("Fetched and cached message for guild %s.", guild_id)
-            except Exception as e:
-                logging.error("Error fetching embed for guild %s: %s", guild_id, e)
-                return self.create_default_embed()
-
-        if embed is None:
-            embed = message.embeds[0] if message.embeds else self.create_default_embed()
-        if self.latest_action:
-            embed.set_footer(text=self.latest_action[LatestActionKeys.TEXT])
-        return embed
+    def _report_missing_setup_perms(
+        self, channel: discord.TextChannel, perms: discord.Permissions
+    ) -> None:
+        """Logs the setup message permissions the bot lacks, once per change."""
+        missing = frozenset(name for name in _SETUP_PERMS if not getattr(perms, name))
+        if self._setup_channel_missing_perms.get(channel.id, frozenset()) == missing:
+            return
+        if not missing:
+            del self._setup_channel_missing_perms[channel.id]
+            return
+        self._setup_channel_missing_perms[channel.id] = missing
+        logging.warning(
+            "Missing %s in setup channel %s of guild %s",
+            ", ".join(sorted(missing)),
+            channel.id,
+            channel.guild.id,
+        )
 
-    async def _update_or_replace_message(
+    async def _sync_setup_message(
         self,
         channel: discord.TextChannel,
         message_id: int,
-        embed: discord.Embed,
+        embed: discord.Embed | None,
         view: discord.ui.View,
+        *,
+        can_send: bool = True,
     ) -> tuple[int, bool, discord.Message | None]:
         """
-        Updates the cached message if possible; if it’s flagged for deletion or not found,
-        sends a new message instead and updates the cache accordingly.
+        Edits the setup message with `embed` and `view`; if it's flagged for deletion
+        or not found, sends a new message instead and updates the cache accordingly.
+        When `embed` is None the message's current embed is reused, which is the only
+        case where an uncached message has to be fetched; otherwise it is edited by ID.
+        Without `can_send` the message is never resent: a flagged message keeps
+        being edited and a missing one is left alone.
 
         Returns:
             new_message_id (int): The ID of the updated or new message.
@@ -842,27 +1057,58 @@ class Bot(commands.Bot):
         """
         guild_id = channel.guild.id
         message = self.setup_message_cache.get(guild_id)
-        try:
-            if message is None:
+        if message is None and embed is None:
+            try:
                 message = await channel.fetch_message(message_id)
-            if message_id in self.delete_message_tags:
+                logging.info("Fetched setup message for guild %s.", guild_id)
+            except discord.NotFound:
+                pass
+            except Exception as e:
+                logging.error("Error fetching embed for guild %s: %s", guild_id, e)
+
+        if embed is None:
+            embed = (
+                message.embeds[0]
+                if message is not None and message.embeds
+                else self.create_default_embed()
+            )
+        # The footer only ever shows the action behind this update; the
+        # fingerprint covers it, so clearing a stale one is never skipped.
+        latest_action = self.latest_actions.get(guild_id)
+        if latest_action and latest_action.text:
+            embed.set_footer(text=latest_action.text)
+        else:
+            embed.remove_footer()
+        if message is None:
+            message = channel.get_partial_message(message_id)
+
+        fingerprint = _setup_message_fingerprint(embed, view)
+        try:
+            if message_id in self.delete_message_tags and can_send:
                 await message.delete()
                 self.delete_message_tags.discard(message_id)
                 new_message = await channel.send(embed=embed, view=view)
-                self.setup_message_cache[guild_id] = new_message
-                return new_message.id, False, new_message
+                edited = False
+            elif self._setup_message_state.get(guild_id) == (message_id, fingerprint):
+                # Nothing visible would change, so skip the request.
+                return message_id, True, self.setup_message_cache.get(guild_id)
             else:
                 new_message = await message.edit(embed=embed, view=view)
-                self.setup_message_cache[guild_id] = new_message
-                return message_id, True, new_message
+                edited = True
         except discord.NotFound:
+            self.delete_message_tags.discard(message_id)
+            if not can_send:
+                return message_id, False, None
             new_message = await channel.send(embed=embed, view=view)
-            self.setup_message_cache[guild_id] = new_message
-            return new_message.id, False, new_message
+            edited = False
         except Exception as e:
             logging.error("Error updating setup message: %s", e)
             return message_id, False, None
 
+        self.setup_message_cache[guild_id] = new_message
+        self._setup_message_state[guild_id] = (new_message.id, fingerprint)
+        return new_message.id, edited, new_message
+
     async def update_setup_buttons(
         self,
         guild: discord.Guild,
@@ -872,6 +1118,14 @@ class Bot(commands.Bot):
         Fetches the cached setup message for the guild and edits it
         with the new View (buttons) only.
         """
+        async with self._setup_message_lock(guild.id):
+            await self._update_setup_buttons(guild, view)
+
+    async def _update_setup_buttons(
+        self,
+        guild: discord.Guild,
+        view: discord.ui.View,
+    ) -> None:
         setup_data = self.setup_channels.get(guild.id)
         if not setup_data:
             return
@@ -879,65 +1133,69 @@ class Bot(commands.Bot):
         channel_id = setup_data.get(SetupChannelKeys.CHANNEL)
         message_id = setup_data.get(SetupChannelKeys.MESSAGE)
 
-        channel = guild.get_channel(channel_id)
+        channel = self.get_setup_channel(guild)
         if channel is None:
             logging.warning(f"Channel {channel_id} not found in guild {guild.id}")
             return
 
         msg = self.setup_message_cache.get(guild.id)
         if msg is None or msg.id != message_id:
-            try:
-                msg = await channel.fetch_message(message_id)
-                self.setup_message_cache[guild.id] = msg
-            except Exception as e:
-                logging.error(f"Could not fetch setup message {message_id}: {e}")
-                return
+            # Only the view changes, so edit by ID; the edit returns the full message.
+            msg = channel.get_partial_message(message_id)
 
         try:
             new_msg = await msg.edit(view=view)
             self.setup_message_cache[guild.id] = new_msg
+            # The buttons changed outside _sync_setup_message's bookkeeping.
+            self._setup_message_state.pop(guild.id, None)
         except Exception as e:
             logging.error(f"Failed to update buttons on setup message: {e}")
 
 
 class QueueView(discord.ui.View):
     def __init__(
-        self, user: discord.User, tracks: List[lavalink.AudioTrack], page_size: int = 15
+        self,
+        user: discord.User,
+        tracks: Sequence[lavalink.AudioTrack],
+        page_size: int = 15,
     ):
         super().__init__(timeout=120)
         self.user = user
         self.tracks = tracks
+        self.page_size = page_size
+        self.track_count = len(tracks)
+        self.total_pages = (self.track_count - 1) // page_size + 1
 
-        # --- PRECOMPUTE ALL PAGES AT INIT TIME ---
-        self.embeds: List[discord.Embed] = []
-        total_pages = (len(tracks) - 1) // page_size + 1
-        for page in range(total_pages):
-            start = page * page_size
-            chunk = tracks[start : start + page_size]
-
-            # build each page’s embed
-            lines = []
-            for i, track in enumerate(chunk, start=start + 1):
-                length = getattr(track, "duration", 0)
-                dur = f"{length//60000}:{(length%60000)//1000:02}"
-                lines.append(f"**{i}.** [{track.title}]({track.uri}) — `{dur}`")
-
-            desc = (
-                f"Page {page+1}/{total_pages}\n"
-                f"Total tracks: {len(tracks)}\n\n" + "\n".join(lines)
-            )
-            embed = discord.Embed(
-                title="Queue", description=desc, color=discord.Color.purple()
-            )
-            self.embeds.append(embed)
+        # Pages are built on first view; most users never leave the first one.
+        self.embeds: dict[int, discord.Embed] = {}
 
         # state
         self.page = 0
         self.prev.disabled = True
-        self.next.disabled = len(self.embeds) <= 1
+        self.next.disabled = self.total_pages <= 1
+
+    def _build_embed(self, page: int) -> discord.Embed:
+        start = page * self.page_size
+        chunk = self.tracks[start : start + self.page_size]
+
+        lines = []
+        for i, track in enumerate(chunk, start=start + 1):
+            dur = format_duration(getattr(track, "duration", 0))
+            lines.append(f"**{i}.** [{track.title}]({track.uri}) — `{dur}`")
+
+        desc = (
+            f"Page {page + 1}/{self.total_pages}\n"
+            f"Total tracks: {self.track_count}\n\n" + "\n".join(lines)
+        )
+        return discord.Embed(
+            title="Queue", description=desc, color=discord.Color.purple()
+        )
 
     def current_embed(self) -> discord.Embed:
-        return self.embeds[self.page]
+        embed = self.embeds.get(self.page)
+        if embed is None:
+            embed = self.embeds[self.page] = self._build_embed(self.page)
+        return embed
 
     # initial message will call .current_embed()
 
@@ -951,6 +1209,6 @@ class QueueView(discord.ui.View):
     @discord.ui.button(label="Next ➡️", style=discord.ButtonStyle.secondary)
     async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
         self.page += 1
-        self.next.disabled = self.page >= len(self.embeds) - 1
+        self.next.disabled = self.page >= self.total_pages - 1
         self.prev.disabled = False
         await interaction.response.edit_message(embed=self.current_embed(), view=self)
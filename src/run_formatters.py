@@ -21,6 +21,7 @@ def run_command(command):
 
 
 if __name__ == "__main__":
-    run_command(["python", "-m", "ruff", "check", ".", "--fix"])
-    run_command(["python", "-m", "isort", "."])
-    run_command(["python", "-m", "black", "."])
+    # Ruff's import sorting and formatter stand in for isort and black, so the
+    # whole pipeline is two invocations of one tool.
+    run_command(["python", "-m", "ruff", "check", ".", "--fix", "--extend-select", "I"])
+    run_command(["python", "-m", "ruff", "format", "."])
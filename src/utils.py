@@ -1,8 +1,10 @@
 import asyncio
-import json
 import logging
 import os
 from dataclasses import dataclass
+from functools import lru_cache
+
+import orjson
 
 SETUP_CHANNELS_FILE = "data/setup_channels.json"
 os.makedirs(os.path.dirname(SETUP_CHANNELS_FILE), exist_ok=True)
@@ -17,9 +19,9 @@ def load_setup_channels() -> dict:
     """
     if os.path.exists(SETUP_CHANNELS_FILE):
         try:
-            with open(SETUP_CHANNELS_FILE, "r") as f:
-                data = json.load(f)
-            return {int(guild_id): info for guild_id, info in data.items()}
+            with open(SETUP_CHANNELS_FILE, "rb") as f:
+                data = orjson.loads(f.read())
+            return dict(zip(map(int, data), data.values()))
         except Exception as e:
             logging.error(f"Failed to load setup channels: {e}")
             return {}
@@ -30,30 +32,36 @@ def load_setup_channels() -> dict:
 def save_setup_channels_sync(data: dict) -> None:
     """
     Saves the setup channels dict to a JSON file.
+    Writes to a temporary file first and renames it so a crash mid-write
+    never leaves a truncated file behind. Guild IDs and SetupChannelKeys are
+    serialized as plain string keys.
 
     Args:
         data: The dict to save.
     """
-    with open(SETUP_CHANNELS_FILE, "w") as f:
-        json.dump(data, f)
+    tmp_path = f"{SETUP_CHANNELS_FILE}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+    os.replace(tmp_path, SETUP_CHANNELS_FILE)
 
 
 async def save_setup_channels_async(data: dict) -> None:
     await asyncio.to_thread(save_setup_channels_sync, data)
 
 
-def remove_setup_channel(guild_id: int, data: dict) -> None:
+def remove_setup_channel(guild_id: int, data: dict) -> bool:
     """
-    Removes the setup channel entry for the given guild ID from the provided data dictionary
-    and saves the updated data to the JSON file.
+    Removes the setup channel entry for the given guild ID from the provided data dictionary.
+    Saving is left to the caller so removals go through the bot's batched writer.
 
     Args:
         guild_id (int): The guild ID to remove.
         data (dict): The current setup channels dictionary.
+
+    Returns:
+        True if an entry was removed.
     """
-    if guild_id in data:
-        del data[guild_id]
-        asyncio.create_task(save_setup_channels_async(data))
+    return data.pop(guild_id, None) is not None
 
 
 def format_duration(ms: int) -> str:
@@ -66,7 +74,12 @@ def format_duration(ms: int) -> str:
     Returns:
         A string formatted as MM:SS or HH:MM:SS.
     """
-    seconds = ms // 1000
+    return _format_seconds(ms // 1000)
+
+
+@lru_cache(maxsize=4096)
+def _format_seconds(seconds: int) -> str:
+    # Keyed on whole seconds so tracks of the same displayed length share an entry.
     minutes, seconds = divmod(seconds, 60)
     hours, minutes = divmod(minutes, 60)
     if hours > 0:
@@ -92,3 +105,11 @@ class Success:
 
     def __str__(self):
         return self.message
+
+
+@dataclass(slots=True)
+class LatestAction:
+    """The most recent user action, shown in the setup embed footer."""
+
+    text: str
+    persist: bool = False
@@ -1,18 +1,56 @@
 import os
+import random
+import socket
 import time
 
 import requests
 
-url = f"http://{os.environ['LAVALINK_HOST']}:{os.environ['LAVALINK_PORT']}/v4/info"
+INITIAL_DELAY = 0.25
+MAX_DELAY = 30
+JITTER = 0.2
+# Report at most this often (in seconds) so fast early polls don't flood the
+# logs, while a long wait still shows regular signs of life.
+LOG_INTERVAL = 10
+
+host = os.environ["LAVALINK_HOST"]
+port = int(os.environ["LAVALINK_PORT"])
+url = f"http://{host}:{port}/v4/info"
 headers = {"Authorization": os.environ["LAVALINK_PASSWORD"]}
 
-while True:
+session = requests.Session()
+session.headers.update(headers)
+
+
+def is_port_open() -> bool:
+    """Cheap liveness probe: can we open a TCP connection to Lavalink?"""
     try:
-        r = requests.get(url, headers=headers, timeout=2)
-        if r.status_code == 200:
-            print("Lavalink is ready!")
-            break
+        with socket.create_connection((host, port), timeout=1):
+            return True
+    except OSError:
+        return False
+
+
+def is_ready() -> bool:
+    """Authenticated check that Lavalink answers and accepts our password."""
+    try:
+        return session.get(url, timeout=2).status_code == 200
     except requests.RequestException:
-        pass
-    print("Waiting for Lavalink...")
-    time.sleep(5)
+        return False
+
+
+delay = INITIAL_DELAY
+attempts = 0
+last_log = None
+while True:
+    if is_port_open() and is_ready():
+        print("Lavalink is ready!")
+        break
+    attempts += 1
+    now = time.monotonic()
+    if last_log is None or now - last_log >= LOG_INTERVAL:
+        last_log = now
+        print(f"Waiting for Lavalink... (attempt {attempts}, next in {delay:.2f}s)")
+    time.sleep(delay * (1 + random.uniform(-JITTER, JITTER)))
+    delay = min(delay * 2, MAX_DELAY)
+
+session.close()